@@ -179,9 +179,7 @@ def parallel_call(args, callback):
 
             entries.append(build_info)
 
-    print(entries)
     errcodes = pool.map(callback, entries)
-    print(errcodes)
 
     is_error = False
     for ret in errcodes:
@@ -373,8 +371,8 @@ def call_linkcheck(build_info):
 GH_LINK_RE = r'https://github.com/espressif/esp-idf/(?:tree|blob|raw)/[^\s]+'
 
 # we allow this one doc, because we always want users to see the latest support policy
-GH_LINK_ALLOWED = ['https://github.com/espressif/esp-idf/blob/master/SUPPORT_POLICY.md',
-                   'https://github.com/espressif/esp-idf/blob/master/SUPPORT_POLICY_CN.md']
+GH_LINK_ALLOWED = frozenset(['https://github.com/espressif/esp-idf/blob/master/SUPPORT_POLICY.md',
+                             'https://github.com/espressif/esp-idf/blob/master/SUPPORT_POLICY_CN.md'])
 
 
 def action_gh_linkcheck(args):
@@ -1,6 +1,7 @@
 import re
 
-from collections import namedtuple
+from bisect import bisect_left
+from collections import defaultdict, namedtuple
 
 LogMessage = namedtuple('LogMessage', 'original_text sanitized_text')
 
@@ -8,6 +9,7 @@ SANITIZE_FILENAME_REGEX = re.compile('[^:]*/([^/:]*)(:.*)')
 SANITIZE_LINENUM_REGEX = re.compile('([^:]*)(:[0-9]+:)(.*)')
 SANITIZE_DUPLICATE_LINENUM_REGEX = re.compile(r'([^:]*)(:[0-9]+\.)(.*)')
 SANITIZE_TERMINAL_CONTROL_REGEX = re.compile(r'\x1B\[[0-9;]*[a-zA-Z]|\[[0-9;]+m')
+ANONYMOUS_FIELD_REGEX = re.compile(r'.+:line: warning: parameters of member [^:\s]+(::[^:\s]+)*(::@\d+)+ are not \(all\) documented')
 
 
 def sanitize_line(line):
@@ -21,10 +23,10 @@ def sanitize_line(line):
         - terminal control characters (like color codes [39;49;00m)
     """
 
-    line = re.sub(SANITIZE_TERMINAL_CONTROL_REGEX, '', line)  # Remove terminal control characters first
-    line = re.sub(SANITIZE_FILENAME_REGEX, r'\1\2', line)
-    line = re.sub(SANITIZE_LINENUM_REGEX, r'\1:line:\3', line)
-    line = re.sub(SANITIZE_DUPLICATE_LINENUM_REGEX, r'\1:line.\3', line)
+    line = SANITIZE_TERMINAL_CONTROL_REGEX.sub('', line)  # Remove terminal control characters first
+    line = SANITIZE_FILENAME_REGEX.sub(r'\1\2', line)
+    line = SANITIZE_LINENUM_REGEX.sub(r'\1:line:\3', line)
+    line = SANITIZE_DUPLICATE_LINENUM_REGEX.sub(r'\1:line.\3', line)
     return line
 
 
@@ -63,17 +65,23 @@ def check_docs(language, target, log_file, known_warnings_file, out_sanitized_lo
         # structs/unions but we don't do this in our docs, so filter these all out with a regex
         # (this won't match any named field, only anonymous members -
         # ie the last part of the field is is just <something>::@NUM not <something>::name)
-        RE_ANONYMOUS_FIELD = re.compile(r'.+:line: warning: parameters of member [^:\s]+(::[^:\s]+)*(::@\d+)+ are not \(all\) documented')
-        all_messages = [msg for msg in all_messages if not re.match(RE_ANONYMOUS_FIELD, msg.sanitized_text)]
+        all_messages = [msg for msg in all_messages if not ANONYMOUS_FIELD_REGEX.match(msg.sanitized_text)]
 
     # Collect all new messages that are not match with the known messages.
     # The order is an important.
+    # Look up the (sorted) positions of each known message instead of scanning the whole list for every message
+    known_positions = defaultdict(list)
+    for idx, known_msg in enumerate(known_messages):
+        known_positions[known_msg].append(idx)
+
     new_messages = list()
     known_idx = 0
     for msg in all_messages:
-        try:
-            known_idx = known_messages.index(msg.sanitized_text, known_idx)
-        except ValueError:
+        positions = known_positions.get(msg.sanitized_text, [])
+        pos_idx = bisect_left(positions, known_idx)
+        if pos_idx < len(positions):
+            known_idx = positions[pos_idx]
+        else:
             new_messages.append(msg)
 
     if new_messages:
@@ -17,7 +17,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-import glob
 import os
 import os.path
 import re
@@ -25,8 +24,6 @@ import stat
 import subprocess
 import tarfile
 
-import packaging.version
-
 
 def env(variable, default=None):
     """ Shortcut to return the expanded version of an environment variable """
@@ -129,11 +126,9 @@ def build_doc_tarball(version, git_ver, build_dir):
     version_paths = []
     tarball_path = '{}/{}.tar.gz'.format(build_dir, version)
 
-    # find all the 'html/' directories under build_dir
-    html_dirs = glob.glob('{}/**/html/'.format(build_dir), recursive=True)
+    # find all the 'html/' directories and PDFs under build_dir
+    html_dirs, pdfs = find_html_dirs_and_pdfs(build_dir)
     print('Found %d html directories' % len(html_dirs))
-
-    pdfs = glob.glob('{}/**/latex/build/*.pdf'.format(build_dir), recursive=True)
     print('Found %d PDFs in latex directories' % len(pdfs))
 
     def not_sources_dir(ti):
@@ -153,14 +148,7 @@ def build_doc_tarball(version, git_ver, build_dir):
         for html_dir in html_dirs:
             # html_dir has the form '<ignored>/<language>/<target>/html/'
             target_dirname = os.path.dirname(os.path.dirname(html_dir))
-            target = os.path.basename(target_dirname)
-            language = os.path.basename(os.path.dirname(target_dirname))
-
-            # when deploying, we want the top-level directory layout 'language/version/target'
-            archive_path = '{}/{}'.format(language, version)
-
-            if target != 'generic':
-                archive_path += '/{}'.format(target)
+            archive_path = get_archive_path(version, target_dirname)
 
             print("Archiving '{}' as '{}'...".format(html_dir, archive_path))
             tarball.add(html_dir, archive_path, filter=not_sources_dir)
@@ -171,16 +159,9 @@ def build_doc_tarball(version, git_ver, build_dir):
             latex_dirname = os.path.dirname(pdf_path)
             pdf_filename = os.path.basename(pdf_path)
             target_dirname = os.path.dirname(os.path.dirname(latex_dirname))
-            target = os.path.basename(target_dirname)
-            language = os.path.basename(os.path.dirname(target_dirname))
 
             # when deploying, we want the layout 'language/version/target/pdf'
-            archive_path = '{}/{}'.format(language, version)
-
-            if target != 'generic':
-                archive_path += '/{}'.format(target)
-
-            archive_path += '/{}'.format(pdf_filename)
+            archive_path = '{}/{}'.format(get_archive_path(version, target_dirname), pdf_filename)
 
             print("Archiving '{}' as '{}'...".format(pdf_path, archive_path))
             tarball.add(pdf_path, archive_path)
@@ -188,6 +169,35 @@ def build_doc_tarball(version, git_ver, build_dir):
     return (os.path.abspath(tarball_path), version_paths)
 
 
+def find_html_dirs_and_pdfs(build_dir):
+    """ Walk build_dir once to find all the 'html/' directories and all the PDFs in 'latex/build/' directories,
+        rather than doing a separate recursive glob over the whole build tree for each """
+    html_dirs = []
+    pdfs = []
+    for root, dirs, files in os.walk(build_dir):
+        # keep the trailing separator, the same as glob returned for '**/html/'
+        html_dirs.extend(os.path.join(root, d, '') for d in dirs if d == 'html')
+
+        if os.path.basename(root) == 'build' and os.path.basename(os.path.dirname(root)) == 'latex':
+            pdfs.extend(os.path.join(root, f) for f in files if f.endswith('.pdf'))
+
+    return html_dirs, pdfs
+
+
+def get_archive_path(version, target_dirname):
+    """ Get the archive path for a '<ignored>/<language>/<target>' build directory,
+        when deploying, we want the top-level directory layout 'language/version/target' """
+    target = os.path.basename(target_dirname)
+    language = os.path.basename(os.path.dirname(target_dirname))
+
+    archive_path = '{}/{}'.format(language, version)
+
+    if target != 'generic':
+        archive_path += '/{}'.format(target)
+
+    return archive_path
+
+
 def is_stable_version(version):
     """ Heuristic for whether this is the latest stable release """
     if not version.startswith('v'):
@@ -195,6 +205,9 @@ def is_stable_version(version):
     if '-' in version:
         return False  # prerelease tag
 
+    # Only needed for release tags, so don't import it for every deploy
+    import packaging.version
+
     git_out = subprocess.check_output(['git', 'tag', '-l']).decode('utf-8')
 
     versions = [v.strip() for v in git_out.split('\n')]
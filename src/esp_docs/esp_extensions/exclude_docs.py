@@ -1,4 +1,4 @@
-from sphinx.util.matching import get_matching_files
+from sphinx.util.matching import compile_matchers, get_matching_files
 
 
 # Updates the excluded documents according to the conditional_include_dict {tag:documents}
@@ -24,11 +24,18 @@ def build_subset(app, config):
     # Convert to list of docs to build
     docs_to_build = config.docs_to_build.split(',')
 
+    # Scan the source directory once and split it into documents to build and documents to exclude.
     # Exclude all documents which were not set as docs_to_build when build_docs were called
-    exclude_docs = [filename for filename in get_matching_files(app.srcdir, exclude_patterns=docs_to_build)]
+    docs_to_build_matchers = compile_matchers(docs_to_build)
+    docs = []
+    exclude_docs = []
+    for filename in get_matching_files(app.srcdir):
+        if is_doc_to_build(docs_to_build_matchers, filename):
+            docs.append(filename)
+        else:
+            exclude_docs.append(filename)
 
     app.config.exclude_patterns.extend(exclude_docs)
-    docs = [filename for filename in get_matching_files(app.srcdir, exclude_patterns=exclude_docs)]
     # Get all docs that will be built
     if not docs:
         raise ValueError('No documents to build')
@@ -42,6 +49,16 @@ def build_subset(app, config):
         config.master_doc = docs[0].replace('.rst', '')
 
 
+def is_doc_to_build(matchers, filename):
+    # A pattern can also match a parent directory (e.g. "api-reference"), in which case all files below it are built
+    path_parts = filename.split('/')
+    for i in range(1, len(path_parts) + 1):
+        path = '/'.join(path_parts[:i])
+        if any(matcher(path) for matcher in matchers):
+            return True
+    return False
+
+
 def setup(app):
     # Tags are generated together with defines
 
@@ -28,11 +28,14 @@ def setup(app):
     return {'parallel_read_safe': True, 'parallel_write_safe': True, 'version': '0.2'}
 
 
+UNREPLACED_SUB_RE = re.compile(r'{IDF_TARGET_.*?}')
+
+
 def check_content(content, docname):
     # Log warnings for any {IDF_TARGET} expressions that haven't been replaced
     logger = logging.getLogger(__name__)
 
-    errors = re.findall(r'{IDF_TARGET_.*?}', content)
+    errors = UNREPLACED_SUB_RE.findall(content)
 
     for err in errors:
         logger.warning('Badly formatted string substitution: {}'.format(err), location=docname)
@@ -122,6 +125,8 @@ class StringSubstituter:
                         'other': 'N/A'}
 
     RE_PATTERN = re.compile(r'^\s*{IDF_TARGET_(\w+?):(.+?)}', re.MULTILINE)
+    RE_DEFAULT_PATTERN = re.compile(r'^\s*default(\s*)=(\s*)\"(.*?)\"')
+    RE_SUB_TAG = re.compile(r'{IDF_TARGET_\w+}')
 
     SUB_LOG_FILE = "IDF_TARGET-substitutions.txt"
 
@@ -142,6 +147,8 @@ class StringSubstituter:
             return
 
         self.target_name = config.idf_target
+        # The target only changes between builds, compile the pattern for local target defines once
+        self.target_pattern = re.compile(r'^.*{}\b(.*?)=(\s*)\"(.*?)\"'.format(self.target_name))
         self.add_pair('{IDF_TARGET_NAME}', TARGET_NAMES[config.idf_target])
         self.add_pair('{IDF_TARGET_PATH_NAME}', config.idf_target)
         self.add_pair('{IDF_TARGET_TOOLCHAIN_PREFIX}', TOOLCHAIN_PREFIX[config.idf_target])
@@ -162,13 +169,13 @@ class StringSubstituter:
 
             tag = '{' + 'IDF_TARGET_{}'.format(sub_def[0]) + '}'
 
-            match_default = re.match(r'^\s*default(\s*)=(\s*)\"(.*?)\"', sub_def[1])
+            match_default = self.RE_DEFAULT_PATTERN.match(sub_def[1])
 
             if match_default is None:
                 # There should always be a default value
                 raise ValueError('No default value in IDF_TARGET_X substitution define, val={}'.format(sub_def))
 
-            match_target = re.match(r'^.*{}\b(.*?)=(\s*)\"(.*?)\"'.format(self.target_name), sub_def[1])
+            match_target = self.target_pattern.match(sub_def[1])
 
             if match_target is None:
                 sub_value = match_default.groups()[2]
@@ -180,24 +187,25 @@ class StringSubstituter:
         return local_sub_strings
 
     def substitute(self, content):
+        # All defines and substitution tags start with "{IDF_TARGET_", most documents have none so skip them early
+        if '{IDF_TARGET_' not in content:
+            return content
+
         # Add any new local tags that matches the reg.ex.
-        sub_defs = re.findall(self.RE_PATTERN, content)
+        sub_defs = self.RE_PATTERN.findall(content)
 
-        local_sub_strings = {}
+        sub_strings = self.substitute_strings
 
         if len(sub_defs) != 0:
-            local_sub_strings.update(self.add_local_subs(sub_defs))
-
-        # Remove the tag defines
-        content = re.sub(self.RE_PATTERN, '', content)
-
-        for key in local_sub_strings:
-            content = content.replace(key, local_sub_strings[key])
+            # Local tags take precedence over the global ones
+            sub_strings = dict(self.substitute_strings)
+            sub_strings.update(self.add_local_subs(sub_defs))
 
-        for key in self.substitute_strings:
-            content = content.replace(key, self.substitute_strings[key])
+            # Remove the tag defines
+            content = self.RE_PATTERN.sub('', content)
 
-        return content
+        # Replace all tags in a single pass, unknown tags are left as is and reported by check_content()
+        return self.RE_SUB_TAG.sub(lambda m: sub_strings.get(m.group(0), m.group(0)), content)
 
     def substitute_source_read_cb(self, app, docname, source):
         source[0] = self.substitute(source[0])
@@ -4,6 +4,7 @@ from __future__ import print_function, unicode_literals
 
 import os
 import re
+import stat
 import subprocess
 from collections import namedtuple
 
@@ -11,8 +12,13 @@ from docutils import nodes
 from ..get_github_rev import get_github_rev
 from sphinx.transforms.post_transforms import SphinxPostTransform
 
+# Patterns used by every GitHub link role, compiled once
+DOUBLE_SLASH_RE = re.compile(r'([^:])//+')
+NAMED_LINK_RE = re.compile(r'(.*)\s*<(.*)>')
+LINE_NO_RE = re.compile(r'^(\d+)(?:-L(\d+))?')
 
-# Creates a dict of all submodules with the format {submodule_path : (url relative to git root), commit)}
+
+# Creates a dict of all submodules with the format {submodule_path : (url relative to git root), commit, directory prefix, path regex)}
 def get_submodules():
     git_root = subprocess.check_output(['git', 'rev-parse', '--show-toplevel']).strip().decode('utf-8')
     gitmodules_file = os.path.join(git_root, '.gitmodules')
@@ -23,7 +29,7 @@ def get_submodules():
         return {}
 
     submodule_dict = {}
-    Submodule = namedtuple('Submodule', 'url rev')
+    Submodule = namedtuple('Submodule', 'url rev dir_prefix path_re')
 
     for sub in submodules:
         sub_info = sub.lstrip().split(' ')
@@ -35,7 +41,9 @@ def get_submodules():
         config_key_arg = 'submodule.{}.url'.format(path)
         rel_url = subprocess.check_output(['git', 'config', '--file', gitmodules_file, '--get', config_key_arg]).decode('utf-8').lstrip('./').rstrip('\n')
 
-        submodule_dict[path] = Submodule(rel_url, rev)
+        # Precompute what redirect_submodule() needs for matching link paths, as it is called for every link role
+        # Add path separator to end of submodule path to ensure we are matching a directory
+        submodule_dict[path] = Submodule(rel_url, rev, os.path.join(path, ''), re.compile('^/{}/'.format(path)))
 
     return submodule_dict
 
@@ -44,10 +52,36 @@ def url_join(*url_parts):
     """ Make a URL out of multiple components, assume first part is the https:// part and
     anything else is a path component """
     result = '/'.join(url_parts)
-    result = re.sub(r'([^:])//+', r'\1/', result)  # remove any // that isn't in the https:// part
+    result = DOUBLE_SLASH_RE.sub(r'\1/', result)  # remove any // that isn't in the https:// part
     return result
 
 
+# Redirects to submodule repo if path is a submodule, else default to IDF repo
+def redirect_submodule(path, submods, rev, repo):
+    stripped_path = path.lstrip('/')
+    for value in submods.values():
+        if stripped_path.startswith(value.dir_prefix):
+            return value.url.replace('.git', ''), value.rev, value.path_re.sub('', path)
+
+    return repo, rev, path
+
+
+# Line counts of files linked with a #L anchor as (mtime, count), keyed by path so each file has a single entry
+# which is replaced when the file changes between builds
+file_line_counts = {}
+
+
+def get_file_line_count(path, mtime_ns):
+    cached = file_line_counts.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        with open(path, 'rb') as f:
+            contents = f.read()
+        # Count newlines in the raw bytes, a last line without a trailing newline still counts as a line
+        cached = (mtime_ns, contents.count(b'\n') + (1 if contents and not contents.endswith(b'\n') else 0))
+        file_line_counts[path] = cached
+    return cached[1]
+
+
 def github_link(link_type, idf_rev, submods, root_path, app_config):
     def role(name, rawtext, text, lineno, inliner, options={}, content=[]):
         msgs = []
@@ -59,17 +93,8 @@ def github_link(link_type, idf_rev, submods, root_path, app_config):
             system_msg.line = lineno
             msgs.append(system_msg)
 
-        # Redirects to submodule repo if path is a submodule, else default to IDF repo
-        def redirect_submodule(path, submods, rev):
-            for key, value in submods.items():
-                # Add path separator to end of submodule path to ensure we are matching a directory
-                if path.lstrip('/').startswith(os.path.join(key, '')):
-                    return value.url.replace('.git', ''), value.rev, re.sub('^/{}/'.format(key), '', path)
-
-            return REPO, rev, path
-
         # search for a named link (:label<path>) with descriptive label vs a plain URL
-        m = re.search(r'(.*)\s*<(.*)>', text)
+        m = NAMED_LINK_RE.search(text)
         if m:
             link_text = m.group(1)
             link = m.group(2)
@@ -80,7 +105,7 @@ def github_link(link_type, idf_rev, submods, root_path, app_config):
         rel_path = root_path + link
         abs_path = os.path.join(app_config.project_path, rel_path.lstrip('/'))
 
-        repo, repo_rev, rel_path = redirect_submodule(rel_path, submods, idf_rev)
+        repo, repo_rev, rel_path = redirect_submodule(rel_path, submods, idf_rev, REPO)
 
         line_no = None
         url = url_join(BASE_URL, repo, link_type, repo_rev, rel_path)
@@ -88,7 +113,7 @@ def github_link(link_type, idf_rev, submods, root_path, app_config):
         if '#L' in abs_path:
             # drop any URL line number from the file, line numbers take the form #Lnnn or #Lnnn-Lnnn for a range
             abs_path, line_no = abs_path.split('#L')
-            line_no = re.search(r'^(\d+)(?:-L(\d+))?', line_no)
+            line_no = LINE_NO_RE.search(line_no)
             if line_no is None:
                 warning("Line number anchor in URL %s doesn't seem to be valid" % link)
             else:
@@ -99,22 +124,28 @@ def github_link(link_type, idf_rev, submods, root_path, app_config):
 
         is_dir = (link_type == 'tree')
 
-        if not os.path.exists(abs_path):
+        # A single stat tells us if the path exists, if it is a directory and when it was last modified
+        try:
+            abs_path_stat = os.stat(abs_path)
+            abs_path_mode = abs_path_stat.st_mode
+        except (OSError, ValueError):
+            abs_path_stat = abs_path_mode = None
+
+        if abs_path_mode is None:
             warning('IDF path %s does not appear to exist (absolute path %s)' % (rel_path, abs_path))
-        elif is_dir and not os.path.isdir(abs_path):
+        elif is_dir and not stat.S_ISDIR(abs_path_mode):
             # note these "wrong type" warnings are not strictly needed  as GitHub will apply a redirect,
             # but the may become important in the future (plus make for cleaner links)
             warning('IDF path %s is not a directory but role :%s: is for linking to a directory, try :%s_file:' % (rel_path, name, name))
-        elif not is_dir and os.path.isdir(abs_path):
+        elif not is_dir and stat.S_ISDIR(abs_path_mode):
             warning('IDF path %s is a directory but role :%s: is for linking to a file' % (rel_path, name))
 
         # check the line number is valid
         if line_no:
             if is_dir:
                 warning('URL %s contains a line number anchor but role :%s: is for linking to a directory' % (rel_path, name))
-            elif os.path.exists(abs_path) and not os.path.isdir(abs_path):
-                with open(abs_path, 'r') as f:
-                    lines = len(f.readlines())
+            elif abs_path_mode is not None and not stat.S_ISDIR(abs_path_mode):
+                lines = get_file_line_count(abs_path, abs_path_stat.st_mtime_ns)
                 if any(True for ln in line_no if ln > lines):
                     warning('URL %s specifies a range larger than file (file has %d lines)' % (rel_path, lines))
 
@@ -142,27 +173,36 @@ class TranslationLinkNodeTransform(SphinxPostTransform):
     default_priority = 0
 
     def run(self, **kwargs):
+        link_nodes = list(self.document.traverse(translation_link))
+        if not link_nodes:
+            return
 
         # Only output relative links if building HTML
-        for node in self.document.traverse(translation_link):
-            if 'html' in self.app.builder.name:
-                rawtext, text, options = node['expr']
-                (language, link_text) = text.split(':')
-                env = self.document.settings.env
-                docname = env.docname
-                doc_path = env.doc2path(docname, False)
-                return_path = '../' * doc_path.count('/')  # path back to the root from 'docname'
-                # then take off 2/3 more paths for language/release/targetname and build the new URL
-                if env.config.idf_target:
-                    url = '{}.html'.format(os.path.join(return_path, '../../..', language, env.config.release,
-                                                        env.config.idf_target, docname))
-                else:
-                    url = '{}.html'.format(os.path.join(return_path, '../..', language, env.config.release,
-                                                        docname))
-
-                node.replace_self(nodes.reference(rawtext, link_text, refuri=url, **options))
-            else:
+        if 'html' not in self.app.builder.name:
+            for node in link_nodes:
                 node.replace_self([])
+            return
+
+        # Everything except the language is the same for all links in this document, so only look it up once
+        env = self.document.settings.env
+        docname = env.docname
+        doc_path = env.doc2path(docname, False)
+        return_path = '../' * doc_path.count('/')  # path back to the root from 'docname'
+        # then take off 2/3 more paths for language/release/targetname and build the new URL
+        # URLs always use '/' so don't build them with os.path.join, which would use '\' on Windows
+        if env.config.idf_target:
+            root_path = return_path + '../../..'
+            version_doc_path = '/'.join([env.config.release, env.config.idf_target, docname])
+        else:
+            root_path = return_path + '../..'
+            version_doc_path = '/'.join([env.config.release, docname])
+
+        for node in link_nodes:
+            rawtext, text, options = node['expr']
+            (language, link_text) = text.split(':')
+            url = '{}/{}/{}.html'.format(root_path, language, version_doc_path)
+
+            node.replace_self(nodes.reference(rawtext, link_text, refuri=url, **options))
 
 
 def setup(app):
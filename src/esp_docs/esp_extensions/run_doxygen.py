@@ -11,6 +11,11 @@ from dataclasses import dataclass
 
 from ..util.util import copy_if_modified
 
+try:
+    import xml.etree.cElementTree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
 ALL_KINDS = [
     ('function', 'Functions'),
     ('union', 'Unions'),
@@ -22,6 +27,9 @@ ALL_KINDS = [
 ]
 """list of items that will be generated for a single API file
 """
+ALL_KINDS_LABELS = dict(ALL_KINDS)
+
+XLT_NAME_TRANSLATION = str.maketrans({'_': '__', '/': '_2'})
 
 
 @dataclass
@@ -104,6 +112,7 @@ def get_header_paths(app, doxyfiles, inc_directory_path, xml_directory_path):
 
     duplicate_dict = defaultdict(list)
     api_path_list = []
+    api_names = []
 
     # Detect headers with the same name, as Doxygen threats these differently
     for header_path in header_paths:
@@ -114,11 +123,12 @@ def get_header_paths(app, doxyfiles, inc_directory_path, xml_directory_path):
             raise RuntimeError('Doxyfile contains duplicate header: {}'.format(header_path))
 
         duplicate_dict[name].append(header_path)
+        api_names.append(name)
 
-    for header_path in header_paths:
+    for header_path, api_name in zip(header_paths, api_names):
         api_path = ApiPath()
 
-        api_path.api_name = get_api_name(header_path)
+        api_path.api_name = api_name
         api_path.header_path = header_path
 
         # If header name is unique then the file name is simply the header name
@@ -169,9 +179,11 @@ def convert_api_xml_to_inc(app, doxyfiles):
             os.makedirs(dir_name, exist_ok=True)
 
         previous_rst_output = ''
-        if os.path.isfile(api_path.inc_file_path):
+        try:
             with open(api_path.inc_file_path, 'r', encoding='utf-8') as inc_file_old:
                 previous_rst_output = inc_file_old.read()
+        except FileNotFoundError:
+            pass
 
         if previous_rst_output != rst_output:
             with open(api_path.inc_file_path, 'w', encoding='utf-8') as inc_file:
@@ -250,9 +262,8 @@ def get_api_name(header_file_path):
 
 def header_to_xml_path(header_file, xml_directory_path):
     # in XLT file name each "_" in the api name is expanded by Doxygen to "__"
-    xlt_api_name = header_file.replace('_', '__')
-    # in XLT file name each "/" in the api name is expanded by Doxygen to "_2"
-    xlt_api_name = xlt_api_name.replace('/', '_2')
+    # and each "/" in the api name is expanded by Doxygen to "_2"
+    xlt_api_name = header_file.translate(XLT_NAME_TRANSLATION)
     xlt_api_name, ext = os.path.splitext(xlt_api_name)
 
     xml_file_path = '%s/%s_8%s.xml' % (xml_directory_path, xlt_api_name, ext[1:])  # extension without "."
@@ -280,11 +291,6 @@ def generate_directives(app, header_file_path, xml_file_path):
     if (app.config.run_doxygen_header_edit_callback):
         rst_output = app.config.run_doxygen_header_edit_callback(rst_output, header_file_path)
 
-    try:
-        import xml.etree.cElementTree as ET
-    except ImportError:
-        import xml.etree.ElementTree as ET
-
     tree = ET.ElementTree(file=xml_file_path)
     for kind, label in ALL_KINDS:
         rst_output += get_directives(tree, kind)
@@ -324,7 +330,7 @@ def select_container(innerclass_list, container):
 
     """
 
-    rst_output = ''
+    rst_output = []
     for line in innerclass_list.splitlines():
         # container is denoted by the keyword "struct", "union" or "class" at the beginning of line
         if line.startswith(container):
@@ -334,14 +340,11 @@ def select_container(innerclass_list, container):
                 continue
             _, name = re.split(r'\t+', line)
 
-            rst_output += '.. doxygen%s:: ' % (container)
-            rst_output += name
-            rst_output += '\n'
+            rst_output.append('.. doxygen%s:: %s\n' % (container, name))
             if container in ["struct", "class"]:
-                rst_output += '    :members:\n'
-                rst_output += '\n'
+                rst_output.append('    :members:\n\n')
 
-    return rst_output
+    return ''.join(rst_output)
 
 
 def get_directives(tree, kind):
@@ -357,23 +360,21 @@ def get_directives(tree, kind):
 
     """
 
-    rst_output = ''
     if kind in ['union', 'struct', 'class']:
-        innerclass_list = ''
-        for elem in tree.iterfind('compounddef/innerclass'):
-            innerclass_list += elem.attrib['refid'] + '\t' + elem.text + '\n'
-        rst_output += select_container(innerclass_list, kind)
+        innerclass_list = ''.join(elem.attrib['refid'] + '\t' + elem.text + '\n'
+                                  for elem in tree.iterfind('compounddef/innerclass'))
+        rst_output = select_container(innerclass_list, kind)
     else:
+        directives = []
         for elem in tree.iterfind(
                 'compounddef/sectiondef/memberdef[@kind="%s"]' % kind):
             name = elem.find('name')
 
             if name.text:
-                rst_output += '.. doxygen%s:: ' % kind
-                rst_output += name.text + '\n'
+                directives.append('.. doxygen%s:: %s\n' % (kind, name.text))
+        rst_output = ''.join(directives)
 
     if rst_output:
-        all_kinds_dict = dict(ALL_KINDS)
-        rst_output = get_rst_header(all_kinds_dict[kind]) + rst_output + '\n'
+        rst_output = get_rst_header(ALL_KINDS_LABELS[kind]) + rst_output + '\n'
 
     return rst_output
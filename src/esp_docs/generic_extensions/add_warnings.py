@@ -17,36 +17,50 @@ import inspect
 import os
 from string import Template
 
+WARNING_TEMPLATE = Template(
+    inspect.cleandoc('''
+        .. warning::
 
-def add_warning(app, docname, source):
-    if not app.config.add_warnings_pages:
-        return
+            $warning
 
-    add_warning_pages_no_file_ext = [os.path.splitext(page)[0] for page in app.config.add_warnings_pages]
+            This warning was automatically inserted due to the source file being in the `add_warnings_pages` list.
+        '''))
 
-    if docname not in add_warning_pages_no_file_ext:
-        return
 
-    WARNING_TEMPLATE = Template(
-        inspect.cleandoc('''
-            .. warning::
+def init_warnings(app, config):
+    # The pages and the warning text are the same for every document, so only compute them once
+    config.add_warnings_docnames = {os.path.splitext(page)[0] for page in config.add_warnings_pages or []}
+
+    if config.add_warnings_docnames:
+        config.add_warnings_text = WARNING_TEMPLATE.substitute(warning=config.add_warnings_content)
+
 
-                $warning
+def add_warning(app, docname, source):
+    if docname not in app.config.add_warnings_docnames:
+        return
 
-                This warning was automatically inserted due to the source file being in the `add_warnings_pages` list.
-            '''))
+    warning_text = app.config.add_warnings_text
 
     # Special case for :orphan: directive, as this must be the first line in the doc
     # if :orphan: append the warning after it, if not prepend it to the source
     source_partition = source[0].partition('\n')
     if source_partition[0] == ':orphan:':
-        source[0] = source_partition[0] + '\n\n' + WARNING_TEMPLATE.substitute(warning=app.config.add_warnings_content) + '\n\n' + source_partition[2]
+        source[0] = source_partition[0] + '\n\n' + warning_text + '\n\n' + source_partition[2]
     else:
-        source[0] = WARNING_TEMPLATE.substitute(warning=app.config.add_warnings_content) + '\n' + '\n' + source[0]
+        source[0] = warning_text + '\n' + '\n' + source[0]
 
 
 def setup(app):
     app.add_config_value('add_warnings_pages', [], 'env')
     app.add_config_value('add_warnings_content', None, 'env')
 
+    # Config values computed from the ones above when the config is initialized
+    app.add_config_value('add_warnings_docnames', set(), 'env')
+    app.add_config_value('add_warnings_text', None, 'env')
+
+    # Run after the default priority, as the pages and content may themselves be set from a config-inited callback
+    app.connect('config-inited', init_warnings, priority=900)
+
     app.connect('source-read', add_warning)
+
+    return {'parallel_read_safe': True, 'parallel_write_safe': True, 'version': '0.1'}
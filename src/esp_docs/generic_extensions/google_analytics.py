@@ -1,4 +1,16 @@
 # Embeds a google analytics tracking tag in every HTML page
+GOOGLE_ANALYTICS_TEMPLATE = """
+        <!-- Global site tag (gtag.js) - Google Analytics -->
+        <script async src="https://www.googletagmanager.com/gtag/js?id={ga_id}"></script>
+        <script>
+            window.dataLayer = window.dataLayer || [];
+            function gtag(){{dataLayer.push(arguments);}}
+            gtag('js', new Date());
+
+            gtag('config', '{ga_id}');
+        </script>"""
+
+
 def setup(app):
     app.add_config_value('google_analytics_id', None, 'html')
     app.connect('html-page-context', google_analytics_embed)
@@ -14,16 +26,7 @@ def google_analytics_embed(app, pagename, templatename, context, doctree):
 
     metatags = context.get('metatags', '')
 
-    google_analytics_snippet = """
-        <!-- Global site tag (gtag.js) - Google Analytics -->
-        <script async src="https://www.googletagmanager.com/gtag/js?id={}"></script>
-        <script>
-            window.dataLayer = window.dataLayer || [];
-            function gtag(){{dataLayer.push(arguments);}}
-            gtag('js', new Date());
-
-            gtag('config', '{}');
-        </script>""".format(ga_id, ga_id)
+    google_analytics_snippet = GOOGLE_ANALYTICS_TEMPLATE.format(ga_id=ga_id)
 
     # Prepend the google analytics to the HTML metatags (which will be passed to the sphinx templating engine)
     metatags = google_analytics_snippet + metatags
@@ -76,6 +76,14 @@ def create_redirect_pages(app):
 
         content = REDIRECT_TEMPLATE.replace('$NEWURL', new_url)
 
+        # Don't rewrite unchanged redirect pages, so their mtime is preserved between incremental builds
+        try:
+            with open(out_file, 'r') as rp:
+                if rp.read() == content:
+                    continue
+        except FileNotFoundError:
+            pass
+
         with open(out_file, 'w') as rp:
             rp.write(content)
 
@@ -37,13 +37,20 @@ class ListFilter(Directive):
         # Raise an error if the directive does not have contents.
         self.assert_has_content()
 
-        # Remove all list entries that should not be on display
+        # Remove all list entries that should not be on display, keeping data and items in step in a single pass
         env = self.state.document.settings.env
-        filt_data = [self.filter_entry(env, e) for e in self.content.data if e is not None]
-
-        # Clean up deleted values from content
-        self.content.data = [data for data in filt_data if data is not None]
-        self.content.items = [items for data, items in zip(filt_data, self.content.items) if data is not None]
+        filt_data = []
+        filt_items = []
+        for entry, items in zip(self.content.data, self.content.items):
+            if entry is None:
+                continue
+            data = self.filter_entry(env, entry)
+            if data is not None:
+                filt_data.append(data)
+                filt_items.append(items)
+
+        self.content.data = filt_data
+        self.content.items = filt_items
 
         # Parse the filtered content and return the new node
         node = nodes.paragraph()
@@ -1,7 +1,10 @@
 import subprocess
+from functools import lru_cache
 
 
 # Get revision used for constructing github URLs
+# Called from both conf_docs.py and the link_roles extension, cache the result to only query git once per build
+@lru_cache(maxsize=None)
 def get_github_rev():
     path = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD']).strip().decode('utf-8')
     try:
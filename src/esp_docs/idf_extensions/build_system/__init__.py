@@ -23,14 +23,15 @@ class IdfBuilder():
     def __init__(self) -> None:
         self.project_description = {}
         self.logger = logging.getLogger(__name__)
-        self.component_info_ignore_headers = []
+        self.component_info_ignore_headers = set()
+        self.component_rel_include_paths = {}
 
     def add_ignored_headers(self, ignore_file):
         with open(ignore_file, 'r') as f:
             for line in f.readlines():
                 if line.startswith('#'):  # Comment, do not add
                     continue
-                self.component_info_ignore_headers.append(line.strip())
+                self.component_info_ignore_headers.add(line.strip())
 
     def generate_idf_info(self, app, config):
         if 'doxygen_component_info' in config.idf_build_system and config.idf_build_system['doxygen_component_info']:
@@ -88,6 +89,27 @@ class IdfBuilder():
 
         return []
 
+    def get_component_rel_include_paths(self, component_name):
+        """Get the public include paths of a component, relative to the component itself.
+
+        Many headers belong to the same component, so the result is computed once per component and cached.
+        """
+        if component_name in self.component_rel_include_paths:
+            return self.component_rel_include_paths[component_name]
+
+        component_info = self.project_description['build_component_info'][component_name]
+        component_include_dirs = component_info['include_dirs']
+        if component_include_dirs is None:
+            self.logger.warning(f'Component {component_name} has no public include directories')
+
+        # convert all include paths to be relative to the component
+        component_include_dirs = [Path(inc_path) for inc_path in component_include_dirs]
+        component_rel_include_paths = [inc_path.relative_to(component_info['dir']) if inc_path.is_absolute() else inc_path
+                                       for inc_path in component_include_dirs]
+
+        self.component_rel_include_paths[component_name] = component_rel_include_paths
+        return component_rel_include_paths
+
     def append_component_info(self, rst_output, header_file_path):
         """Appends build specific component info to the rst for the API-reference header include.
 
@@ -145,15 +167,7 @@ class IdfBuilder():
                                 f'not found in project_description[build_component_info]')
             return rst_output
 
-        component_info = self.project_description['build_component_info'][component_name]
-        component_include_dirs = component_info['include_dirs']
-        if component_include_dirs is None:
-            self.logger.warning(f'Component {component_name} has no public include directories')
-
-        # convert all include paths to be relative to the component
-        component_include_dirs = [Path(inc_path) for inc_path in component_include_dirs]
-        component_rel_include_paths = [inc_path.relative_to(component_info['dir']) if inc_path.is_absolute() else inc_path
-                                       for inc_path in component_include_dirs]
+        component_rel_include_paths = self.get_component_rel_include_paths(component_name)
 
         rel_include_path = find_include_path(header_file_path.relative_to(Path('components') / component_name), component_rel_include_paths)
 
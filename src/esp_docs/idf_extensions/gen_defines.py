@@ -11,6 +11,9 @@ import pprint
 import re
 import subprocess
 
+# Matches a single line of C preprocessor '-dM' output
+DEFINE_RE = re.compile(r'#define ([^ ]+) ?(.*)')
+
 
 def generate_defines(app, project_description):
     sdk_config_path = os.path.join(project_description['build_dir'], 'config')
@@ -57,7 +60,7 @@ def get_defines(header_path, sdk_config_path, compiler):
                                                 '-dM', '-E', header_path]).decode()
     for line in processed_output.split('\n'):
         line = line.strip()
-        m = re.search('#define ([^ ]+) ?(.*)', line)
+        m = DEFINE_RE.search(line)
         if m:
             name = m.group(1)
             value = m.group(2)
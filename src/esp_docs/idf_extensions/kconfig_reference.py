@@ -26,9 +26,10 @@ def generate_reference(app, project_description):
     kconfig_projbuilds = project_description['config_environment']['COMPONENT_KCONFIGS_PROJBUILD'].split(';')
 
     sdkconfig_renames = set()
+    # Most components have both a Kconfig and a Kconfig.projbuild, only check each component directory once
+    component_dirs = {os.path.dirname(k) for k in kconfigs + kconfig_projbuilds}
     # TODO: this should be generated in project description as well, if possible
-    for k in kconfigs + kconfig_projbuilds:
-        component_dir = os.path.dirname(k)
+    for component_dir in component_dirs:
         sdkconfig_rename = os.path.join(component_dir, 'sdkconfig.rename')
         if os.path.exists(sdkconfig_rename):
             sdkconfig_renames.add(sdkconfig_rename)
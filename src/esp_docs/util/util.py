@@ -42,12 +42,14 @@ def files_equal(path_1, path_2):
     return file_1_contents == file_2_contents
 
 
-def copy_file_if_modified(src_file_path, dst_file_path):
-    if not files_equal(src_file_path, dst_file_path):
-        dst_dir_name = os.path.dirname(dst_file_path)
-        if not os.path.isdir(dst_dir_name):
-            os.makedirs(dst_dir_name)
-        shutil.copy(src_file_path, dst_file_path)
+def copy_file_if_modified(src_file_path, dst_file_path, dst_dir_exists=False):
+    if files_equal(src_file_path, dst_file_path):
+        return False
+    dst_dir_name = os.path.dirname(dst_file_path)
+    if not dst_dir_exists and not os.path.isdir(dst_dir_name):
+        os.makedirs(dst_dir_name)
+    shutil.copy(src_file_path, dst_file_path)
+    return True
 
 
 def copy_if_modified(src_path, dst_path):
@@ -57,10 +59,12 @@ def copy_if_modified(src_path, dst_path):
 
     src_path_len = len(src_path)
     for root, dirs, files in os.walk(src_path):
+        dst_dir_name = dst_path + root[src_path_len:]
+        # All files in root are copied to the same directory, only check for it before the first copy
+        dst_dir_exists = False
         for src_file_name in files:
-            src_file_path = os.path.join(root, src_file_name)
-            dst_file_path = os.path.join(dst_path + root[src_path_len:], src_file_name)
-            copy_file_if_modified(src_file_path, dst_file_path)
+            if copy_file_if_modified(os.path.join(root, src_file_name), os.path.join(dst_dir_name, src_file_name), dst_dir_exists):
+                dst_dir_exists = True
 
 
 def download_file_if_missing(from_url, to_path):
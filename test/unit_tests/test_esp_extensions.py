@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 
+import os
 import os.path as path
+import tempfile
 import unittest
 from unittest.mock import MagicMock
 
+from sphinx.application import Sphinx
 from sphinx.util import tags
 from esp_docs.esp_extensions import exclude_docs, format_esp_target
 
@@ -40,6 +43,17 @@ class TestFormatIdfTarget(unittest.TestCase):
 
         self.assertEqual(self.str_sub.substitute(content), expected)
 
+    def test_sub_no_tags(self):
+        content = 'This document has no target specific content, {IDF_TARGET} is left as is'
+
+        self.assertEqual(self.str_sub.substitute(content), content)
+
+    def test_sub_unknown_tag(self):
+        content = 'The {IDF_TARGET_NAME} has no {IDF_TARGET_UNKNOWN_TAG}'
+
+        expected = 'The ESP32 has no {IDF_TARGET_UNKNOWN_TAG}'
+        self.assertEqual(self.str_sub.substitute(content), expected)
+
     def test_local_sub(self):
         content = ('{IDF_TARGET_TX_PIN:default="IO3", esp32="IO4", esp32s2="IO5"}'
                    'The {IDF_TARGET_NAME} UART {IDF_TARGET_TX_PIN} uses for TX')
@@ -88,5 +102,39 @@ class TestExclude(unittest.TestCase):
         self.assertFalse(docs_to_build & set(self.app.config.exclude_patterns))
 
 
+class TestAddWarnings(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.src_dir = path.join(self.temp_dir.name, 'src')
+        self.build_dir = path.join(self.temp_dir.name, 'build')
+
+        conf = ('extensions = [\'esp_docs.generic_extensions.add_warnings\']\n'
+                '\n'
+                'def set_warnings(app, config):\n'
+                '    config.add_warnings_pages = [\'index.rst\']\n'
+                '    config.add_warnings_content = \'Not yet updated\'\n'
+                '\n'
+                'def setup(app):\n'
+                '    app.connect(\'config-inited\', set_warnings)\n')
+
+        os.mkdir(self.src_dir)
+        with open(path.join(self.src_dir, 'conf.py'), 'w') as f:
+            f.write(conf)
+        with open(path.join(self.src_dir, 'index.rst'), 'w') as f:
+            f.write('Index\n=====\n')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_pages_set_from_config_inited(self):
+        app = Sphinx(self.src_dir, self.src_dir, self.build_dir, path.join(self.build_dir, '.doctrees'), 'text',
+                     status=None, warning=None)
+        app.build()
+
+        with open(path.join(self.build_dir, 'index.txt')) as f:
+            self.assertIn('Not yet updated', f.read())
+
+
 if __name__ == '__main__':
     unittest.main()